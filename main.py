@@ -47,7 +47,7 @@ class GestureControlSystem:
         self.threads = []
         
         # Initialize components
-        self.config_manager = ConfigManager()
+        self.config_manager = ConfigManager.get()
         self.performance_monitor = PerformanceMonitor()
         self.hand_detector = HandDetector(self.config_manager)
         self.gesture_recognizer = GestureRecognizer(self.config_manager)
@@ -65,11 +65,16 @@ class GestureControlSystem:
         self.capture_thread = None
         self.processing_thread = None
         self.ui_thread = None
+        self._stop_evt = threading.Event()
         
-        # Shared data structures
-        self.frame_queue = []
-        self.gesture_queue = []
-        self.queue_lock = threading.Lock()
+        # Single-slot "latest frame" mailbox shared between threads.
+        # The slot holds exactly one frame; unread frames are simply
+        # overwritten so producers never block behind slow consumers.
+        # Both slots are published by atomic attribute rebind of fresh
+        # objects, so readers take no lock and get stable references.
+        self.frame_seq = 0
+        self.latest_frame = None
+        self.latest_gesture = None
         
     def initialize_camera(self):
         """Initialize camera with error handling"""
@@ -96,7 +101,8 @@ class GestureControlSystem:
     def capture_frames(self):
         """Capture frames from camera in separate thread"""
         self.logger.info("Starting frame capture thread")
-        
+
+        deadline = time.monotonic()
         while self.running:
             try:
                 with self.camera_lock:
@@ -107,12 +113,15 @@ class GestureControlSystem:
                     if not ret:
                         continue
                 
-                # Add frame to queue (keep only latest frame to prevent lag)
-                with self.queue_lock:
-                    self.frame_queue = [frame]  # Replace with latest frame
+                # Publish to the mailbox (keep only latest frame to prevent lag)
+                self.latest_frame = frame
+                self.frame_seq += 1
                 
-                # Control frame rate
-                time.sleep(1/30)  # Target 30 FPS
+                # Pace to the next 33 ms boundary on the monotonic clock
+                # (no drift); the event lets shutdown wake us immediately
+                deadline += 1/30  # Target 30 FPS
+                if self._stop_evt.wait(max(0.0, deadline - time.monotonic())):
+                    break
                 
             except Exception as e:
                 self.logger.error(f"Error in frame capture: {e}")
@@ -126,14 +135,14 @@ class GestureControlSystem:
         
         while self.running:
             try:
-                # Get latest frame
-                frame = None
-                with self.queue_lock:
-                    if self.frame_queue:
-                        frame = self.frame_queue[0]
+                # Get latest frame from the mailbox
+                frame = self.latest_frame
                 
                 if frame is None:
-                    time.sleep(0.01)
+                    # Event wait instead of a plain sleep so shutdown
+                    # wakes this thread immediately
+                    if self._stop_evt.wait(0.01):
+                        break
                     continue
                 
                 # Detect hands
@@ -144,14 +153,13 @@ class GestureControlSystem:
                     gesture, confidence = self.gesture_recognizer.recognize_gesture(hand_landmarks)
                     
                     if gesture and confidence > self.config_manager.get_gesture_threshold():
-                        # Add to gesture queue
-                        with self.queue_lock:
-                            self.gesture_queue.append({
-                                'gesture': gesture,
-                                'confidence': confidence,
-                                'timestamp': time.time(),
-                                'landmarks': hand_landmarks
-                            })
+                        # Publish most recent gesture (atomic attribute rebind)
+                        self.latest_gesture = {
+                            'gesture': gesture,
+                            'confidence': confidence,
+                            'timestamp': time.time(),
+                            'landmarks': hand_landmarks
+                        }
                         
                         # Execute system action
                         self.system_controller.execute_gesture_action(gesture, confidence)
@@ -161,13 +169,15 @@ class GestureControlSystem:
                 
             except Exception as e:
                 self.logger.error(f"Error in gesture processing: {e}")
-                time.sleep(0.1)
+                if self._stop_evt.wait(0.1):
+                    break
         
         self.logger.info("Gesture processing thread stopped")
     
     def start_threads(self):
         """Start all processing threads"""
         self.running = True
+        self._stop_evt.clear()
         
         # Start capture thread
         self.capture_thread = threading.Thread(target=self.capture_frames, daemon=True)
@@ -185,6 +195,7 @@ class GestureControlSystem:
         """Stop all processing threads gracefully"""
         self.logger.info("Stopping all threads...")
         self.running = False
+        self._stop_evt.set()
         
         # Wait for threads to finish
         for thread in self.threads:
@@ -201,20 +212,9 @@ class GestureControlSystem:
     
     def get_latest_frame_data(self):
         """Get latest frame and gesture data for UI"""
-        frame_data = None
-        gesture_data = None
-        
-        with self.queue_lock:
-            if self.frame_queue:
-                frame_data = self.frame_queue[0].copy()
-            
-            if self.gesture_queue:
-                # Get most recent gesture
-                gesture_data = self.gesture_queue[-1]
-                # Keep only recent gestures (last 10)
-                self.gesture_queue = self.gesture_queue[-10:]
-        
-        return frame_data, gesture_data
+        # The producers always publish fresh objects, so the returned
+        # references are stable and nothing is allocated or copied here
+        return self.latest_frame, self.latest_gesture
     
     def run(self):
         """Main application entry point"""
@@ -8,11 +8,18 @@ from tkinter import ttk
 import cv2
 import numpy as np
 from PIL import Image, ImageTk
+import concurrent.futures
 import logging
 import threading
 import time
 from typing import Optional, Any
 
+# MediaPipe hand landmark index groups for batched drawing
+_TIP_IDX = np.array([4, 8, 12, 16, 20], dtype=np.int32)
+_JOINT_IDX = np.array([2, 3, 5, 6, 7, 9, 10, 11, 13, 14, 15, 17, 18, 19], dtype=np.int32)
+_PALM_IDX = np.array([0, 1], dtype=np.int32)
+_LABEL_IDX = np.array([0, 4, 8, 12, 16, 20], dtype=np.int32)
+
 
 class CameraPreview:
     """Camera preview widget with hand landmark visualization"""
@@ -28,6 +35,10 @@ class CameraPreview:
         self.frame = ttk.Frame(parent)
         self.canvas = None
         self.photo = None
+
+        # Reusable RGB buffer for BGR->RGB conversion (avoids one
+        # width*height*3 allocation per displayed frame)
+        self._rgb_buf = np.empty((height, width, 3), dtype=np.uint8)
         
         # Update control
         self.update_active = True
@@ -40,6 +51,17 @@ class CameraPreview:
         self.show_connections = True
         self.show_gesture_info = True
         
+        # Background hand detection so MediaPipe inference never blocks
+        # the Tk thread; the preview draws the most recent result, which
+        # may be one frame stale
+        self._detect_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._detect_future = None
+        self._last_landmarks = None
+
+        # Cache for cv2.getTextSize results, keyed by string length
+        # (digit/period glyph widths are constant for a given length)
+        self._text_size_cache = {}
+
         # Colors for visualization
         self.colors = {
             'landmarks': (0, 255, 0),      # Green
@@ -99,9 +121,11 @@ class CameraPreview:
     def update_frame(self):
         """Update camera preview with latest frame"""
         try:
-            # Get latest frame and gesture data
-            frame_data, gesture_data = self.gesture_system.get_latest_frame_data()
-            
+            # Read the producer's published slots directly (no lock, no
+            # tuple allocation per tick)
+            frame_data = self.gesture_system.latest_frame
+            gesture_data = self.gesture_system.latest_gesture
+
             if frame_data is None:
                 return
             
@@ -126,10 +150,18 @@ class CameraPreview:
             # Resize frame to canvas size
             display_frame = cv2.resize(display_frame, (self.width, self.height))
             
-            # Get hand landmarks if available
+            # Get hand landmarks if available; detection runs in a worker
+            # thread so the Tk mainloop never blocks on inference
             hands_landmarks = None
             if hasattr(self.gesture_system, 'hand_detector'):
-                hands_landmarks = self.gesture_system.hand_detector.detect_hands(display_frame)
+                if self._detect_future is None or self._detect_future.done():
+                    if self._detect_future is not None:
+                        self._last_landmarks = self._detect_future.result()
+                    self._detect_future = self._detect_executor.submit(
+                        self.gesture_system.hand_detector.detect_hands,
+                        display_frame.copy()
+                    )
+                hands_landmarks = self._last_landmarks
             
             # Draw hand landmarks and connections
             if hands_landmarks and (self.show_landmarks or self.show_connections):
@@ -155,13 +187,17 @@ class CameraPreview:
                 return frame
             
             for landmarks in hands_landmarks:
+                # Convert to pixel-space int32 points once per hand; the draw
+                # helpers consume the array directly with no per-point casts
+                pts = np.asarray(landmarks, dtype=np.float32)[:, :2].astype(np.int32)
+
                 # Draw connections between landmarks
                 if self.show_connections:
-                    frame = self.draw_hand_connections(frame, landmarks)
-                
+                    frame = self.draw_hand_connections(frame, pts)
+
                 # Draw individual landmarks
                 if self.show_landmarks:
-                    frame = self.draw_hand_landmarks(frame, landmarks)
+                    frame = self.draw_hand_landmarks(frame, pts)
             
             return frame
             
@@ -169,37 +205,40 @@ class CameraPreview:
             self.logger.error(f"Error drawing hand overlays: {e}")
             return frame
     
-    def draw_hand_landmarks(self, frame: np.ndarray, landmarks) -> np.ndarray:
-        """Draw hand landmark points"""
+    def draw_hand_landmarks(self, frame: np.ndarray, pts: np.ndarray) -> np.ndarray:
+        """Draw hand landmark points from pixel-space (N, 2) int32 points"""
         try:
-            for i, (x, y, z) in enumerate(landmarks):
-                # Different colors for different types of landmarks
-                if i in [4, 8, 12, 16, 20]:  # Finger tips
-                    color = (0, 255, 0)  # Green
-                    radius = 6
-                elif i in [2, 3, 5, 6, 7, 9, 10, 11, 13, 14, 15, 17, 18, 19]:  # Joints
-                    color = (255, 255, 0)  # Yellow
-                    radius = 4
-                else:  # Wrist and palm
-                    color = (255, 0, 0)  # Red
-                    radius = 5
-                
-                # Draw landmark point
-                cv2.circle(frame, (int(x), int(y)), radius, color, -1)
-                
-                # Draw landmark number (optional, for debugging)
-                if i in [0, 4, 8, 12, 16, 20]:  # Key landmarks only
-                    cv2.putText(frame, str(i), (int(x) + 10, int(y) - 10),
+            # Batch-classify landmark indices once, then draw each group in a
+            # tight loop with constant color/radius (no per-point branching)
+            idx = np.arange(pts.shape[0])
+            tips = pts[np.isin(idx, _TIP_IDX)]
+            joints = pts[np.isin(idx, _JOINT_IDX)]
+            palm = pts[np.isin(idx, _PALM_IDX)]
+
+            for x, y in tips:  # Finger tips - green
+                cv2.circle(frame, (x, y), 6, (0, 255, 0), -1)
+
+            for x, y in joints:  # Joints - yellow
+                cv2.circle(frame, (x, y), 4, (255, 255, 0), -1)
+
+            for x, y in palm:  # Wrist and palm - red
+                cv2.circle(frame, (x, y), 5, (255, 0, 0), -1)
+
+            # Draw landmark numbers for key landmarks only (for debugging)
+            for i in _LABEL_IDX:
+                if i < pts.shape[0]:
+                    color = (0, 255, 0) if i else (255, 0, 0)
+                    cv2.putText(frame, str(i), (pts[i, 0] + 10, pts[i, 1] - 10),
                                cv2.FONT_HERSHEY_SIMPLEX, 0.3, color, 1)
-            
+
             return frame
-            
+
         except Exception as e:
             self.logger.error(f"Error drawing hand landmarks: {e}")
             return frame
     
-    def draw_hand_connections(self, frame: np.ndarray, landmarks) -> np.ndarray:
-        """Draw connections between hand landmarks"""
+    def draw_hand_connections(self, frame: np.ndarray, pts: np.ndarray) -> np.ndarray:
+        """Draw connections between hand landmarks from (N, 2) int32 points"""
         try:
             # MediaPipe hand connections
             connections = [
@@ -217,14 +256,12 @@ class CameraPreview:
                 (5, 9), (9, 13), (13, 17)
             ]
             
+            n = pts.shape[0]
             for start_idx, end_idx in connections:
-                if start_idx < len(landmarks) and end_idx < len(landmarks):
-                    start_point = landmarks[start_idx]
-                    end_point = landmarks[end_idx]
-                    
+                if start_idx < n and end_idx < n:
                     cv2.line(frame,
-                            (int(start_point[0]), int(start_point[1])),
-                            (int(end_point[0]), int(end_point[1])),
+                            (pts[start_idx, 0], pts[start_idx, 1]),
+                            (pts[end_idx, 0], pts[end_idx, 1]),
                             self.colors['connections'], 2)
             
             return frame
@@ -275,7 +312,10 @@ class CameraPreview:
         try:
             # Draw FPS in bottom right
             fps_text = f"FPS: {self.fps_counter:.1f}"
-            text_size = cv2.getTextSize(fps_text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
+            text_size = self._text_size_cache.get(len(fps_text))
+            if text_size is None:
+                text_size = cv2.getTextSize(fps_text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
+                self._text_size_cache[len(fps_text)] = text_size
             cv2.putText(frame, fps_text,
                        (self.width - text_size[0] - 10, self.height - 10),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
@@ -293,11 +333,19 @@ class CameraPreview:
     def display_frame(self, frame: np.ndarray):
         """Display processed frame on canvas"""
         try:
-            # Convert BGR to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Convert to PIL Image
-            pil_image = Image.fromarray(rgb_frame)
+            # Convert BGR to RGB into the preallocated buffer when the frame
+            # matches the canvas size; fall back to a fresh buffer otherwise
+            if frame.shape == self._rgb_buf.shape:
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+                rgb_frame = self._rgb_buf
+            else:
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+            # Wrap the buffer as a PIL Image without copying
+            pil_image = Image.frombuffer(
+                'RGB', (rgb_frame.shape[1], rgb_frame.shape[0]),
+                rgb_frame, 'raw', 'RGB', 0, 1
+            )
             
             # Convert to PhotoImage
             self.photo = ImageTk.PhotoImage(image=pil_image)
@@ -370,7 +418,9 @@ class CameraPreview:
         """Cleanup camera preview resources"""
         try:
             self.update_active = False
-            
+
+            self._detect_executor.shutdown(wait=False)
+
             if self.canvas:
                 self.canvas.delete("all")
             
@@ -4,18 +4,13 @@ Primary user interface for the gesture control system
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 import logging
-import threading
 import time
 from typing import Optional, Any
-import os
-import sys
 
-# Add src directory to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-
-from ui.camera_preview import CameraPreview
+from .camera_preview import CameraPreview
 
 
 class MainWindow:
@@ -30,19 +25,51 @@ class MainWindow:
         
         # UI update control
         self.ui_update_active = True
-        self.ui_update_thread = None
+        self._preview_tick_id = None
+        self._metrics_tick_id = None
+        self._last_seq = -1
         
         # Current gesture display
         self.current_gesture = None
         self.current_confidence = 0.0
+
+        # Last-displayed values, used to skip redundant widget writes
+        self._last = {}
+        self._last_pct = -1
+
+        # Last displayed metric values rounded to label precision; format
+        # strings are only built when the rounded value changes
+        self._last_rounded = {}
+        self._last_sec = -1
+
+        # Debounced status bar updates (slider drags fire in bursts)
+        self._pending_status = None
+        self._status_after = None
+
+        # Trailing-edge commit of slider values to the config manager
+        self._pending_threshold = None
+        self._threshold_after = None
+        self._pending_detection = None
+        self._detection_after = None
         
         # Performance metrics
         self.fps_counter = 0
         self.last_fps_time = time.time()
+
+        # Pre-bound module functions used in the tick path; locals-style
+        # binding avoids repeated module attribute lookups per call
+        self._time = time.time
+        self._strftime = time.strftime
+        self._localtime = time.localtime
         
         # Initialize UI
         self.setup_window()
         self.create_widgets()
+
+        # Bind the preview update once; the tick calls it directly
+        # instead of re-resolving the attribute every 33 ms
+        self._preview_update = self.camera_preview.update_frame
+
         self.start_ui_updates()
         
         self.logger.info("MainWindow initialized")
@@ -67,7 +94,15 @@ class MainWindow:
         
         # Style configuration
         self.style = ttk.Style()
-        
+
+        # Shared named fonts; Tk reuses one Font object per style instead
+        # of parsing an inline tuple for every widget
+        self.fonts = {
+            'bold12': tkfont.Font(family='Arial', size=12, weight='bold'),
+            'bold10': tkfont.Font(family='Arial', size=10, weight='bold'),
+            'small8': tkfont.Font(family='Arial', size=8)
+        }
+
         # Configure colors and fonts
         self.colors = {
             'bg_primary': '#2C3E50',
@@ -120,7 +155,7 @@ class MainWindow:
         gesture_status_frame.grid_columnconfigure(1, weight=1)
         
         ttk.Label(gesture_status_frame, text="Current Gesture:").grid(row=0, column=0, sticky="w")
-        self.gesture_label = ttk.Label(gesture_status_frame, text="None", font=("Arial", 12, "bold"))
+        self.gesture_label = ttk.Label(gesture_status_frame, text="None", font=self.fonts['bold12'])
         self.gesture_label.grid(row=0, column=1, sticky="w", padx=(10, 0))
         
         ttk.Label(gesture_status_frame, text="Confidence:").grid(row=1, column=0, sticky="w")
@@ -157,6 +192,10 @@ class MainWindow:
         controls_frame = ttk.LabelFrame(parent, text="System Controls", padding="10")
         controls_frame.pack(fill="x", pady=(0, 10))
         
+        # Lay the buttons out with a single grid so geometry is computed
+        # once instead of per pack() call
+        controls_frame.grid_columnconfigure(0, weight=1)
+
         # Emergency stop button
         self.emergency_button = ttk.Button(
             controls_frame,
@@ -164,73 +203,95 @@ class MainWindow:
             command=self.emergency_stop,
             style="Danger.TButton"
         )
-        self.emergency_button.pack(fill="x", pady=(0, 5))
-        
+        self.emergency_button.grid(row=0, column=0, sticky="ew", pady=(0, 5))
+
         # Pause/Resume button
         self.pause_button = ttk.Button(
             controls_frame,
             text="Pause Recognition",
             command=self.toggle_recognition
         )
-        self.pause_button.pack(fill="x", pady=(0, 5))
-        
+        self.pause_button.grid(row=1, column=0, sticky="ew", pady=(0, 5))
+
         # Reset button
         reset_button = ttk.Button(
             controls_frame,
             text="Reset System",
             command=self.reset_system
         )
-        reset_button.pack(fill="x")
+        reset_button.grid(row=2, column=0, sticky="ew")
     
     def create_performance_display(self, parent):
         """Create performance monitoring display"""
         perf_frame = ttk.LabelFrame(parent, text="Performance", padding="10")
         perf_frame.pack(fill="x", pady=(0, 10))
         
+        # One grid of name/value rows instead of a nested frame + two
+        # pack() calls per metric; layout is computed in a single pass
+        perf_frame.grid_columnconfigure(1, weight=1)
+
         # FPS display
-        fps_frame = ttk.Frame(perf_frame)
-        fps_frame.pack(fill="x")
-        ttk.Label(fps_frame, text="FPS:").pack(side="left")
-        self.fps_label = ttk.Label(fps_frame, text="0", font=("Arial", 10, "bold"))
-        self.fps_label.pack(side="right")
-        
+        ttk.Label(perf_frame, text="FPS:").grid(row=0, column=0, sticky="w")
+        self.fps_label = ttk.Label(perf_frame, text="0", font=self.fonts['bold10'])
+        self.fps_label.grid(row=0, column=1, sticky="e")
+
         # CPU usage
-        cpu_frame = ttk.Frame(perf_frame)
-        cpu_frame.pack(fill="x")
-        ttk.Label(cpu_frame, text="CPU:").pack(side="left")
-        self.cpu_label = ttk.Label(cpu_frame, text="0%")
-        self.cpu_label.pack(side="right")
-        
+        ttk.Label(perf_frame, text="CPU:").grid(row=1, column=0, sticky="w")
+        self.cpu_label = ttk.Label(perf_frame, text="0%")
+        self.cpu_label.grid(row=1, column=1, sticky="e")
+
         # Memory usage
-        mem_frame = ttk.Frame(perf_frame)
-        mem_frame.pack(fill="x")
-        ttk.Label(mem_frame, text="Memory:").pack(side="left")
-        self.memory_label = ttk.Label(mem_frame, text="0 MB")
-        self.memory_label.pack(side="right")
-        
+        ttk.Label(perf_frame, text="Memory:").grid(row=2, column=0, sticky="w")
+        self.memory_label = ttk.Label(perf_frame, text="0 MB")
+        self.memory_label.grid(row=2, column=1, sticky="e")
+
         # Detection rate
-        detect_frame = ttk.Frame(perf_frame)
-        detect_frame.pack(fill="x")
-        ttk.Label(detect_frame, text="Detection Rate:").pack(side="left")
-        self.detection_label = ttk.Label(detect_frame, text="0%")
-        self.detection_label.pack(side="right")
+        ttk.Label(perf_frame, text="Detection Rate:").grid(row=3, column=0, sticky="w")
+        self.detection_label = ttk.Label(perf_frame, text="0%")
+        self.detection_label.grid(row=3, column=1, sticky="e")
     
     def create_gesture_mappings(self, parent):
         """Create gesture mappings display"""
-        mappings_frame = ttk.LabelFrame(parent, text="Gesture Mappings", padding="10")
-        mappings_frame.pack(fill="x", pady=(0, 10))
-        
-        # Get gesture mappings from system controller
+        self.mappings_frame = ttk.LabelFrame(parent, text="Gesture Mappings", padding="10")
+        self.mappings_frame.pack(fill="x", pady=(0, 10))
+
+        self._mapping_hash = None
+        self._mapping_rows = []
+
+        self.refresh_mappings()
+
+    def refresh_mappings(self):
+        """Rebuild the mapping rows only when the mappings actually changed
+
+        Widget creation/destruction is among the slowest Tk operations, so
+        the rows are left untouched when the mappings dict is unchanged.
+        """
         try:
             mappings = self.gesture_system.system_controller.get_gesture_mappings()
-            
+
+            mapping_hash = hash(tuple(sorted(mappings.items())))
+            if mapping_hash == self._mapping_hash:
+                return
+            self._mapping_hash = mapping_hash
+
+            # Tear down the previous rows before rebuilding
+            for row in self._mapping_rows:
+                row.destroy()
+            self._mapping_rows = []
+
+            # Build all row widgets first, then let Tk run a single layout
+            # pass instead of recomputing geometry per inserted widget
             for gesture, action in mappings.items():
-                mapping_frame = ttk.Frame(mappings_frame)
+                mapping_frame = ttk.Frame(self.mappings_frame)
                 mapping_frame.pack(fill="x", pady=1)
-                
+
                 ttk.Label(mapping_frame, text=f"{gesture}:", width=12).pack(side="left")
-                ttk.Label(mapping_frame, text=action, font=("Arial", 8)).pack(side="left", padx=(5, 0))
-                
+                ttk.Label(mapping_frame, text=action, font=self.fonts['small8']).pack(side="left", padx=(5, 0))
+
+                self._mapping_rows.append(mapping_frame)
+
+            self.mappings_frame.update_idletasks()
+
         except Exception as e:
             self.logger.error(f"Error creating gesture mappings display: {e}")
     
@@ -251,7 +312,7 @@ class MainWindow:
             to=1.0,
             orient="horizontal",
             variable=self.threshold_var,
-            command=self.update_gesture_threshold
+            command=self._on_threshold_drag
         )
         threshold_scale.pack(side="right", fill="x", expand=True, padx=(10, 0))
         
@@ -267,7 +328,7 @@ class MainWindow:
             to=1.0,
             orient="horizontal",
             variable=self.detection_var,
-            command=self.update_detection_confidence
+            command=self._on_detection_drag
         )
         detection_scale.pack(side="right", fill="x", expand=True, padx=(10, 0))
         
@@ -297,99 +358,166 @@ class MainWindow:
         self.time_label.pack(side="right")
     
     def start_ui_updates(self):
-        """Start UI update thread"""
-        self.ui_update_thread = threading.Thread(target=self.update_ui_loop, daemon=True)
-        self.ui_update_thread.start()
-        self.logger.info("UI update thread started")
-    
-    def update_ui_loop(self):
-        """Main UI update loop running in separate thread"""
-        while self.ui_update_active:
-            try:
-                # Update UI elements
-                self.root.after(0, self.update_ui_elements)
-                time.sleep(1/30)  # 30 FPS UI updates
-                
-            except Exception as e:
-                self.logger.error(f"Error in UI update loop: {e}")
-                time.sleep(0.1)
-    
-    def update_ui_elements(self):
-        """Update UI elements with current system state"""
+        """Schedule UI updates on the Tk event loop
+
+        The camera preview ticks at ~30 FPS while the much cheaper metric
+        labels only need ~5 Hz, so each runs on its own after() chain.
+        """
+        self.root.after_idle(self._preview_tick)
+        self.root.after_idle(self._metrics_tick)
+        self.logger.info("UI update scheduling started")
+
+    def _preview_tick(self):
+        """Update the camera preview and reschedule at ~30 FPS"""
+        if not self.ui_update_active:
+            return
+
         try:
-            # Update camera preview
-            if hasattr(self.camera_preview, 'update_frame'):
-                self.camera_preview.update_frame()
-            
-            # Get latest gesture data
-            frame_data, gesture_data = self.gesture_system.get_latest_frame_data()
-            
-            if gesture_data:
-                gesture = gesture_data.get('gesture', 'None')
-                confidence = gesture_data.get('confidence', 0.0)
-                
-                self.current_gesture = gesture
-                self.current_confidence = confidence
-                
-                # Update gesture display
-                self.gesture_label.config(text=gesture or "None")
-                self.confidence_label.config(text=f"{confidence*100:.1f}%")
-                self.confidence_progress['value'] = confidence * 100
-            
-            # Update performance metrics
-            self.update_performance_display()
-            
-            # Update status bar
-            current_time = time.strftime("%H:%M:%S")
-            self.time_label.config(text=current_time)
-            
+            # Only redraw when the producer has published a new frame;
+            # otherwise the conversion + PhotoImage upload is wasted work
+            seq = self.gesture_system.frame_seq
+            if seq != self._last_seq:
+                self._last_seq = seq
+                self._preview_update()
         except Exception as e:
-            self.logger.error(f"Error updating UI elements: {e}")
-    
-    def update_performance_display(self):
-        """Update performance metrics display"""
+            self.logger.error(f"Error in preview tick: {e}")
+
+        self._preview_tick_id = self.root.after(33, self._preview_tick)
+
+    def _metrics_tick(self):
+        """Update gesture/metric labels and reschedule at ~5 Hz"""
+        if not self.ui_update_active:
+            return
+
         try:
-            # Get performance data
-            perf_data = self.performance_monitor.get_current_metrics()
-            
-            # Update FPS
-            fps = perf_data.get('fps', 0)
-            self.fps_label.config(text=f"{fps:.1f}")
-            
-            # Update CPU usage
-            cpu_usage = perf_data.get('cpu_percent', 0)
-            self.cpu_label.config(text=f"{cpu_usage:.1f}%")
-            
-            # Update memory usage
-            memory_mb = perf_data.get('memory_mb', 0)
-            self.memory_label.config(text=f"{memory_mb:.1f} MB")
-            
-            # Update detection rate
-            detection_rate = perf_data.get('detection_rate', 0)
-            self.detection_label.config(text=f"{detection_rate*100:.1f}%")
-            
+            self.update_ui_elements()
+            # Cheap when nothing changed: the mapping hash short-circuits
+            # before any widget work
+            self.refresh_mappings()
         except Exception as e:
-            self.logger.error(f"Error updating performance display: {e}")
+            self.logger.error(f"Error in metrics tick: {e}")
+
+        self._metrics_tick_id = self.root.after(200, self._metrics_tick)
+
+    def _set(self, label, key, text):
+        """Write label text only when it differs from the last shown value"""
+        if self._last.get(key) != text:
+            label.config(text=text)
+            self._last[key] = text
+    
+    def update_ui_elements(self):
+        """Update UI elements with current system state
+
+        Exceptions are handled once in _metrics_tick rather than per call.
+        """
+        # Read the producer's published gesture snapshot (no locks)
+        gesture_data = self.gesture_system.latest_gesture
+
+        if gesture_data:
+            gesture = gesture_data.get('gesture', 'None')
+            confidence = gesture_data.get('confidence', 0.0)
+
+            self.current_gesture = gesture
+            self.current_confidence = confidence
+
+            # Update gesture display
+            self._set(self.gesture_label, 'gesture', gesture or "None")
+
+            conf_r = int(confidence * 1000)  # 0.1% display precision
+            if self._last_rounded.get('confidence') != conf_r:
+                self._last_rounded['confidence'] = conf_r
+                self._set(self.confidence_label, 'confidence', f"{confidence*100:.1f}%")
+
+            # Progressbar only needs updating on visible (1%) change
+            pct = int(confidence * 100)
+            if pct != self._last_pct:
+                self.confidence_progress['value'] = pct
+                self._last_pct = pct
+
+        # Update performance metrics from the monitor's published
+        # snapshot (no locks)
+        perf_data = self.performance_monitor.latest_metrics
+
+        last_rounded = self._last_rounded
+
+        # Update FPS
+        fps = perf_data.get('fps', 0)
+        fps_r = int(fps * 10)
+        if last_rounded.get('fps') != fps_r:
+            last_rounded['fps'] = fps_r
+            self._set(self.fps_label, 'fps', f"{fps:.1f}")
+
+        # Update CPU usage
+        cpu_usage = perf_data.get('cpu_percent', 0)
+        cpu_r = int(cpu_usage * 10)
+        if last_rounded.get('cpu') != cpu_r:
+            last_rounded['cpu'] = cpu_r
+            self._set(self.cpu_label, 'cpu', f"{cpu_usage:.1f}%")
+
+        # Update memory usage
+        memory_mb = perf_data.get('memory_mb', 0)
+        mem_r = int(memory_mb * 10)
+        if last_rounded.get('memory') != mem_r:
+            last_rounded['memory'] = mem_r
+            self._set(self.memory_label, 'memory', f"{memory_mb:.1f} MB")
+
+        # Update detection rate
+        detection_rate = perf_data.get('detection_rate', 0)
+        det_r = int(detection_rate * 1000)
+        if last_rounded.get('detection') != det_r:
+            last_rounded['detection'] = det_r
+            self._set(self.detection_label, 'detection', f"{detection_rate*100:.1f}%")
+
+        # Update status bar clock; strftime only runs when the second changes
+        now = int(self._time())
+        if now != self._last_sec:
+            self._last_sec = now
+            self._set(self.time_label, 'time',
+                      self._strftime("%H:%M:%S", self._localtime(now)))
     
-    def update_gesture_threshold(self, value):
-        """Update gesture recognition threshold"""
+    def _on_threshold_drag(self, value):
+        """Record dragged threshold value; commit after drag settles"""
+        try:
+            self._pending_threshold = float(value)
+            if self._threshold_after is not None:
+                self.root.after_cancel(self._threshold_after)
+            self._threshold_after = self.root.after(150, self._commit_threshold)
+
+        except Exception as e:
+            self.logger.error(f"Error updating gesture threshold: {e}")
+
+    def _commit_threshold(self):
+        """Commit the final gesture threshold to the config manager"""
         try:
-            threshold = float(value)
+            self._threshold_after = None
+            threshold = self._pending_threshold
             self.config_manager.set_gesture_threshold(threshold)
             self.update_status(f"Gesture threshold updated to {threshold:.2f}")
-            
+
         except Exception as e:
-            self.logger.error(f"Error updating gesture threshold: {e}")
-    
-    def update_detection_confidence(self, value):
-        """Update detection confidence threshold"""
+            self.logger.error(f"Error committing gesture threshold: {e}")
+
+    def _on_detection_drag(self, value):
+        """Record dragged detection confidence; commit after drag settles"""
+        try:
+            self._pending_detection = float(value)
+            if self._detection_after is not None:
+                self.root.after_cancel(self._detection_after)
+            self._detection_after = self.root.after(150, self._commit_detection)
+
+        except Exception as e:
+            self.logger.error(f"Error updating detection confidence: {e}")
+
+    def _commit_detection(self):
+        """Commit the final detection confidence to the config manager"""
         try:
-            confidence = float(value)
+            self._detection_after = None
+            confidence = self._pending_detection
             self.config_manager.set_detection_confidence(confidence)
             self.update_status(f"Detection confidence updated to {confidence:.2f}")
-            
+
         except Exception as e:
-            self.logger.error(f"Error updating detection confidence: {e}")
+            self.logger.error(f"Error committing detection confidence: {e}")
     
     def save_settings(self):
         """Save current settings to configuration file"""
@@ -435,22 +563,55 @@ class MainWindow:
             self.logger.error(f"Error resetting system: {e}")
     
     def update_status(self, message: str):
-        """Update status bar message"""
+        """Update status bar message, coalescing bursts of updates"""
         try:
-            self.status_label.config(text=message)
-            self.logger.info(f"Status: {message}")
-            
+            self._pending_status = message
+            if self._status_after is None:
+                self._status_after = self.root.after(50, self._flush_status)
+
         except Exception as e:
             self.logger.error(f"Error updating status: {e}")
+
+    def _flush_status(self):
+        """Commit the most recent pending status message"""
+        try:
+            self._status_after = None
+            message = self._pending_status
+            self._pending_status = None
+
+            if message is not None:
+                self.status_label.config(text=message)
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("Status: %s", message)
+
+        except Exception as e:
+            self.logger.error(f"Error flushing status: {e}")
     
     def cleanup(self):
         """Cleanup UI resources"""
         try:
             self.ui_update_active = False
-            
-            if self.ui_update_thread and self.ui_update_thread.is_alive():
-                self.ui_update_thread.join(timeout=1.0)
-            
+
+            if self._preview_tick_id is not None:
+                self.root.after_cancel(self._preview_tick_id)
+                self._preview_tick_id = None
+
+            if self._metrics_tick_id is not None:
+                self.root.after_cancel(self._metrics_tick_id)
+                self._metrics_tick_id = None
+
+            if self._status_after is not None:
+                self.root.after_cancel(self._status_after)
+                self._status_after = None
+
+            if self._threshold_after is not None:
+                self.root.after_cancel(self._threshold_after)
+                self._threshold_after = None
+
+            if self._detection_after is not None:
+                self.root.after_cancel(self._detection_after)
+                self._detection_after = None
+
             if hasattr(self.camera_preview, 'cleanup'):
                 self.camera_preview.cleanup()
             
@@ -4,403 +4,605 @@ Handles application settings and configuration persistence
 """
 
 import configparser
+import json
 import os
 import logging
-from typing import Any, Dict, Optional
+import sys
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+# Section/key names form a small fixed vocabulary; interning them turns
+# dict-key equality into a pointer compare and reuses cached hashes
+_intern = sys.intern
 
 
 class ConfigManager:
     """Manages application configuration and settings"""
-    
+
+    # Default configuration values; built once at class definition so
+    # every instance shares the same immutable structures
+    _DEFAULTS = {
+        'detection': {
+            'min_detection_confidence': '0.7',
+            'min_tracking_confidence': '0.5',
+            'max_num_hands': '2'
+        },
+        'gesture_recognition': {
+            'gesture_threshold': '0.85',
+            'cooldown_period': '1.0',
+            'smoothing_buffer_size': '5'
+        },
+        'system_control': {
+            'action_cooldown': '1.0',
+            'volume_step': '5',
+            'enable_audio_control': 'true'
+        },
+        'ui': {
+            'window_width': '1000',
+            'window_height': '700',
+            'camera_width': '640',
+            'camera_height': '480',
+            'update_rate': '30'
+        },
+        'performance': {
+            'target_fps': '30',
+            'max_cpu_usage': '25',
+            'max_memory_mb': '200',
+            'enable_gpu_acceleration': 'false'
+        },
+        'logging': {
+            'log_level': 'INFO',
+            'log_to_file': 'true',
+            'max_log_size_mb': '10'
+        }
+    }
+
+    _DEFAULTS = {
+        _intern(section): {_intern(key): value for key, value in values.items()}
+        for section, values in _DEFAULTS.items()
+    }
+
+    # Flat (section, key, value) view for single-loop iteration in
+    # create_default_config/validate_config
+    _DEFAULTS_FLAT = tuple(
+        (section, key, value)
+        for section, values in _DEFAULTS.items()
+        for key, value in values.items()
+    )
+
+    # Strings treated as true by get_boolean; anything else is false.
+    # A frozenset membership test beats configparser's BOOLEAN_STATES
+    # dict round-trip and never raises on unexpected values
+    _BOOL_TRUE = frozenset(('true', '1', 'yes', 'on', 't', 'y'))
+
+    # Type tags for the generic-accessor cache; keying by
+    # (section, key, tag) keeps the str/float/int/bool getters from
+    # serving each other's parsed values
+    _CACHE_TAGS = ('str', 'float', 'int', 'bool')
+
+    # Declarative accessor specs: (name, kind, section, key, default,
+    # description). The typed get_<name>/is_<name>/set_<name> methods are
+    # generated from this table at class-definition time by
+    # _install_accessors below, all sharing the _typed_cache memo
+    _ACCESSORS = (
+        ('detection_confidence', 'float', 'detection', 'min_detection_confidence', 0.7,
+         'hand detection confidence threshold'),
+        ('tracking_confidence', 'float', 'detection', 'min_tracking_confidence', 0.5,
+         'hand tracking confidence threshold'),
+        ('max_hands', 'int', 'detection', 'max_num_hands', 2,
+         'maximum number of hands to detect'),
+        ('gesture_threshold', 'float', 'gesture_recognition', 'gesture_threshold', 0.85,
+         'gesture recognition confidence threshold'),
+        ('gesture_cooldown', 'float', 'gesture_recognition', 'cooldown_period', 1.0,
+         'gesture cooldown period in seconds'),
+        ('smoothing_buffer_size', 'int', 'gesture_recognition', 'smoothing_buffer_size', 5,
+         'gesture smoothing buffer size'),
+        ('action_cooldown', 'float', 'system_control', 'action_cooldown', 1.0,
+         'system action cooldown period in seconds'),
+        ('volume_step', 'int', 'system_control', 'volume_step', 5,
+         'volume adjustment step size'),
+        ('audio_control_enabled', 'bool', 'system_control', 'enable_audio_control', True,
+         'audio control'),
+        ('ui_update_rate', 'int', 'ui', 'update_rate', 30,
+         'UI update rate in FPS'),
+        ('target_fps', 'int', 'performance', 'target_fps', 30,
+         'target processing FPS'),
+        ('max_cpu_usage', 'float', 'performance', 'max_cpu_usage', 25.0,
+         'maximum CPU usage threshold'),
+        ('max_memory_mb', 'int', 'performance', 'max_memory_mb', 200,
+         'maximum memory usage in MB'),
+        ('gpu_acceleration_enabled', 'bool', 'performance', 'enable_gpu_acceleration', False,
+         'GPU acceleration'),
+        ('log_level', 'str', 'logging', 'log_level', 'INFO',
+         'logging level'),
+        ('log_to_file_enabled', 'bool', 'logging', 'log_to_file', True,
+         'logging to file'),
+        ('max_log_size_mb', 'int', 'logging', 'max_log_size_mb', 10,
+         'maximum log file size in MB'),
+    )
+
+    # (section, key) pairs every valid config must contain; lets
+    # validate_config answer the common all-present case with a single
+    # set comparison instead of nested has_option probing
+    _REQUIRED = frozenset((section, key) for section, key, _ in _DEFAULTS_FLAT)
+
+    # Shared instances keyed by config path; components that call
+    # ConfigManager.get() reuse one manager (and its caches) per file
+    # instead of re-reading and re-parsing the INI per constructor call
+    _instances: Dict[str, "ConfigManager"] = {}
+
+    @classmethod
+    def get(cls, config_file: str = "config/settings.ini") -> "ConfigManager":
+        """Get the shared ConfigManager for a config file, creating it once"""
+        instance = cls._instances.get(config_file)
+        if instance is None:
+            instance = cls(config_file)
+        return instance
+
+    @classmethod
+    def invalidate(cls, config_file: str = "config/settings.ini"):
+        """Drop the shared instance so the next get() reloads from disk"""
+        cls._instances.pop(config_file, None)
+
     def __init__(self, config_file: str = "config/settings.ini"):
         self.logger = logging.getLogger(__name__)
         self.config_file = config_file
         self.config = configparser.ConfigParser()
+
+        # JSON sidecar written alongside the INI on every save; loading
+        # from it skips configparser's line-by-line INI parsing entirely
+        self.snapshot_file = os.path.splitext(config_file)[0] + '.snapshot.json'
+
+        # Cache of parsed values keyed by (section, key); configparser
+        # re-walks sections and re-parses strings on every get, which is
+        # wasted work for values read once per frame
+        self._cache = {}
+
+        # Memo for the named typed accessors (get_detection_confidence,
+        # get_gesture_threshold, ...); a KeyError-miss dict lookup is far
+        # cheaper than re-running the configparser machinery per frame
+        self._typed_cache = {}
+
+        # Plain nested dict mirror of the parsed config; reads go through
+        # this instead of configparser, which is only kept around for
+        # reading and writing the INI file on disk
+        self._flat = {}
+
+        # Section names already present in the parser; saves a
+        # has_section call per set_value
+        self._known_sections = set()
+
+        # Batch-update support: inside a batch() block save_config only
+        # marks the config dirty, and the file is written once on exit
+        self._batch_depth = 0
+        self._dirty = False
+
+        # Sections modified since the last write; save_config becomes a
+        # no-op while this is empty so redundant saves never hit the disk
+        self._dirty_sections = set()
+
+        # Cached size tuples so the tuple accessors don't rebuild a
+        # fresh tuple from two int reads per call
+        self._window_size = None
+        self._camera_size = None
         
-        # Default configuration values
-        self.defaults = {
-            'detection': {
-                'min_detection_confidence': '0.7',
-                'min_tracking_confidence': '0.5',
-                'max_num_hands': '2'
-            },
-            'gesture_recognition': {
-                'gesture_threshold': '0.85',
-                'cooldown_period': '1.0',
-                'smoothing_buffer_size': '5'
-            },
-            'system_control': {
-                'action_cooldown': '1.0',
-                'volume_step': '5',
-                'enable_audio_control': 'true'
-            },
-            'ui': {
-                'window_width': '1000',
-                'window_height': '700',
-                'camera_width': '640',
-                'camera_height': '480',
-                'update_rate': '30'
-            },
-            'performance': {
-                'target_fps': '30',
-                'max_cpu_usage': '25',
-                'max_memory_mb': '200',
-                'enable_gpu_acceleration': 'false'
-            },
-            'logging': {
-                'log_level': 'INFO',
-                'log_to_file': 'true',
-                'max_log_size_mb': '10'
-            }
-        }
-        
-        # Ensure config directory exists
+        # Configuration is loaded lazily on first access so constructing
+        # a manager (e.g. at import time) costs no disk IO
+        self._loaded = False
+
+        # Register as the shared instance for this file so later
+        # ConfigManager.get() calls reuse this manager and its caches
+        # instead of spawning a second one racing writes to the same INI
+        self._instances.setdefault(config_file, self)
+
+        self.logger.info("ConfigManager initialized")
+
+    def _ensure_loaded(self):
+        """Read the config from disk on first access"""
+        if self._loaded:
+            return
+        self._loaded = True
         self.ensure_config_directory()
-        
-        # Load configuration
         self.load_config()
-        
-        self.logger.info("ConfigManager initialized")
     
     def ensure_config_directory(self):
         """Ensure configuration directory exists"""
         try:
             config_dir = os.path.dirname(self.config_file)
-            if config_dir and not os.path.exists(config_dir):
-                os.makedirs(config_dir)
-                self.logger.info(f"Created config directory: {config_dir}")
-                
+            if config_dir:
+                os.makedirs(config_dir, exist_ok=True)
+
         except Exception as e:
-            self.logger.error(f"Error creating config directory: {e}")
+            self.logger.error("Error creating config directory: %s", e)
     
     def load_config(self):
         """Load configuration from file or create with defaults"""
         try:
-            if os.path.exists(self.config_file):
-                self.config.read(self.config_file)
-                self.logger.info(f"Configuration loaded from {self.config_file}")
-            else:
-                self.logger.info("Configuration file not found, creating with defaults")
-                self.create_default_config()
-                
-            # Validate and update configuration
-            self.validate_config()
-            
+            self._cache.clear()
+            self._typed_cache.clear()
+            self._window_size = None
+            self._camera_size = None
+            with self.batch():
+                if self._load_snapshot():
+                    self.logger.info("Configuration loaded from %s", self.snapshot_file)
+                elif self.config.read(self.config_file):
+                    self.logger.info("Configuration loaded from %s", self.config_file)
+                else:
+                    self.logger.info("Configuration file not found, creating with defaults")
+                    self.create_default_config()
+
+                # Validate and update configuration
+                if self.validate_config():
+                    self.save_config()
+            self._rebuild_flat()
+
         except Exception as e:
-            self.logger.error(f"Error loading configuration: {e}")
+            self.logger.error("Error loading configuration: %s", e)
             self.create_default_config()
+
+    def _load_snapshot(self) -> bool:
+        """Load config from the JSON snapshot if it is at least as new as the INI"""
+        try:
+            if os.path.getmtime(self.snapshot_file) < os.path.getmtime(self.config_file):
+                return False
+
+            with open(self.snapshot_file) as snapshot_file:
+                self.config.read_dict(json.load(snapshot_file))
+            return True
+
+        except OSError:
+            # Snapshot or INI missing; fall back to the normal INI read
+            return False
+        except Exception as e:
+            self.logger.error("Error loading config snapshot: %s", e)
+            return False
+
+    def _rebuild_flat(self):
+        """Rebuild the flat dict mirror from the configparser state"""
+        self._flat = {section: dict(self.config.items(section))
+                      for section in self.config.sections()}
+        self._known_sections = set(self._flat)
     
     def create_default_config(self):
         """Create configuration file with default values"""
         try:
             # Add all default sections and values
-            for section, values in self.defaults.items():
+            for section, key, value in self._DEFAULTS_FLAT:
                 if not self.config.has_section(section):
                     self.config.add_section(section)
-                
-                for key, value in values.items():
-                    self.config.set(section, key, value)
-            
+                self.config.set(section, key, value)
+                self._dirty_sections.add(section)
+
             # Save to file
             self.save_config()
+            self._rebuild_flat()
             self.logger.info("Default configuration created")
             
         except Exception as e:
-            self.logger.error(f"Error creating default configuration: {e}")
+            self.logger.error("Error creating default configuration: %s", e)
     
-    def validate_config(self):
-        """Validate configuration and add missing defaults"""
+    def validate_config(self) -> bool:
+        """Validate configuration and add missing defaults
+
+        Returns True when defaults were added; writing the updated
+        config back is left to the caller.
+        """
         try:
+            # Fast path: nothing to add when every required pair is present
+            have = {(section, key)
+                    for section in self.config.sections()
+                    for key in self.config.options(section)}
+            if self._REQUIRED.issubset(have):
+                return False
+
             config_updated = False
-            
-            for section, values in self.defaults.items():
+
+            for section, key, default_value in self._DEFAULTS_FLAT:
                 if not self.config.has_section(section):
                     self.config.add_section(section)
                     config_updated = True
-                
-                for key, default_value in values.items():
-                    if not self.config.has_option(section, key):
-                        self.config.set(section, key, default_value)
-                        config_updated = True
-            
+
+                if not self.config.has_option(section, key):
+                    self.config.set(section, key, default_value)
+                    self._dirty_sections.add(section)
+                    config_updated = True
+
             if config_updated:
-                self.save_config()
+                self._cache.clear()
+                self._typed_cache.clear()
+                self._window_size = None
+                self._camera_size = None
+                self._rebuild_flat()
                 self.logger.info("Configuration updated with missing defaults")
-                
+            return config_updated
+
         except Exception as e:
-            self.logger.error(f"Error validating configuration: {e}")
+            self.logger.error("Error validating configuration: %s", e)
+            return False
     
+    @contextmanager
+    def batch(self):
+        """Defer saves inside the block and write the file once at the end"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.save_config()
+
     def save_config(self):
         """Save current configuration to file"""
+        if not self._dirty_sections:
+            return
+        if self._batch_depth:
+            self._dirty = True
+            return
         try:
-            with open(self.config_file, 'w') as config_file:
-                self.config.write(config_file)
-            self.logger.info(f"Configuration saved to {self.config_file}")
-            
+            self._dirty = False
+            self._atomic_write(self.config_file, self.config.write)
+
+            # Keep the fast-load snapshot in step with the INI
+            snapshot = {section: dict(self.config.items(section))
+                        for section in self.config.sections()}
+            self._atomic_write(self.snapshot_file,
+                               lambda f: json.dump(snapshot, f))
+
+            self._dirty_sections.clear()
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Configuration saved to %s", self.config_file)
+
         except Exception as e:
-            self.logger.error(f"Error saving configuration: {e}")
+            self.logger.error("Error saving configuration: %s", e)
             raise
+
+    @staticmethod
+    def _atomic_write(path, write):
+        """Write a file atomically: temp file, fsync, then rename over"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as tmp_file:
+            write(tmp_file)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, path)
     
     def get_value(self, section: str, key: str, fallback: Any = None) -> str:
         """Get configuration value with fallback"""
-        try:
-            return self.config.get(section, key, fallback=str(fallback) if fallback is not None else None)
-        except Exception as e:
-            self.logger.error(f"Error getting config value [{section}]{key}: {e}")
-            return str(fallback) if fallback is not None else ""
-    
+        self._ensure_loaded()
+        section = _intern(section)
+        key = _intern(key)
+        cache_key = (section, key, 'str')
+        value = self._cache.get(cache_key)
+        if value is None:
+            value = self._flat.get(section, {}).get(key)
+            if value is None:
+                # Missing key: honor the caller's fallback without
+                # caching it, since another caller may pass a different one
+                return str(fallback) if fallback is not None else None
+            self._cache[cache_key] = value
+        return value
+
     def set_value(self, section: str, key: str, value: Any):
         """Set configuration value"""
-        try:
+        self._ensure_loaded()
+        section = _intern(section)
+        key = _intern(key)
+        if section not in self._known_sections:
             if not self.config.has_section(section):
                 self.config.add_section(section)
-            
-            self.config.set(section, key, str(value))
-            self.logger.debug(f"Set config value [{section}]{key} = {value}")
-            
-        except Exception as e:
-            self.logger.error(f"Error setting config value [{section}]{key}: {e}")
-    
+            self._known_sections.add(section)
+
+        str_value = value if type(value) is str else str(value)
+        self.config.set(section, key, str_value)
+        self._dirty_sections.add(section)
+        self._flat.setdefault(section, {})[key] = str_value
+        for tag in self._CACHE_TAGS:
+            self._cache.pop((section, key, tag), None)
+        typed_name = self._TYPED_BY_KEY.get((section, key))
+        if typed_name is not None:
+            self._typed_cache.pop(typed_name, None)
+        if section == 'ui':
+            if key in ('window_width', 'window_height'):
+                self._window_size = None
+            elif key in ('camera_width', 'camera_height'):
+                self._camera_size = None
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Set config value [%s]%s = %s", section, key, str_value)
+
     def get_float(self, section: str, key: str, fallback: float = 0.0) -> float:
         """Get float configuration value"""
-        try:
-            return self.config.getfloat(section, key, fallback=fallback)
-        except Exception as e:
-            self.logger.error(f"Error getting float config value [{section}]{key}: {e}")
-            return fallback
-    
+        self._ensure_loaded()
+        section = _intern(section)
+        key = _intern(key)
+        cache_key = (section, key, 'float')
+        value = self._cache.get(cache_key)
+        if value is None:
+            raw = self._flat.get(section, {}).get(key)
+            if raw is None:
+                return fallback
+            try:
+                value = float(raw)
+            except ValueError:
+                self.logger.warning("Invalid float value for [%s]%s: %r, using fallback",
+                                    section, key, raw)
+                return fallback
+            self._cache[cache_key] = value
+        return value
+
     def get_int(self, section: str, key: str, fallback: int = 0) -> int:
         """Get integer configuration value"""
-        try:
-            return self.config.getint(section, key, fallback=fallback)
-        except Exception as e:
-            self.logger.error(f"Error getting int config value [{section}]{key}: {e}")
-            return fallback
-    
+        self._ensure_loaded()
+        section = _intern(section)
+        key = _intern(key)
+        cache_key = (section, key, 'int')
+        value = self._cache.get(cache_key)
+        if value is None:
+            raw = self._flat.get(section, {}).get(key)
+            if raw is None:
+                return fallback
+            try:
+                value = int(raw)
+            except ValueError:
+                self.logger.warning("Invalid integer value for [%s]%s: %r, using fallback",
+                                    section, key, raw)
+                return fallback
+            self._cache[cache_key] = value
+        return value
+
     def get_boolean(self, section: str, key: str, fallback: bool = False) -> bool:
         """Get boolean configuration value"""
-        try:
-            return self.config.getboolean(section, key, fallback=fallback)
-        except Exception as e:
-            self.logger.error(f"Error getting boolean config value [{section}]{key}: {e}")
-            return fallback
-    
-    # Detection settings
-    def get_detection_confidence(self) -> float:
-        """Get hand detection confidence threshold"""
-        return self.get_float('detection', 'min_detection_confidence', 0.7)
-    
-    def set_detection_confidence(self, value: float):
-        """Set hand detection confidence threshold"""
-        self.set_value('detection', 'min_detection_confidence', value)
-    
-    def get_tracking_confidence(self) -> float:
-        """Get hand tracking confidence threshold"""
-        return self.get_float('detection', 'min_tracking_confidence', 0.5)
-    
-    def set_tracking_confidence(self, value: float):
-        """Set hand tracking confidence threshold"""
-        self.set_value('detection', 'min_tracking_confidence', value)
-    
-    def get_max_hands(self) -> int:
-        """Get maximum number of hands to detect"""
-        return self.get_int('detection', 'max_num_hands', 2)
-    
-    def set_max_hands(self, value: int):
-        """Set maximum number of hands to detect"""
-        self.set_value('detection', 'max_num_hands', value)
-    
-    # Gesture recognition settings
-    def get_gesture_threshold(self) -> float:
-        """Get gesture recognition confidence threshold"""
-        return self.get_float('gesture_recognition', 'gesture_threshold', 0.85)
-    
-    def set_gesture_threshold(self, value: float):
-        """Set gesture recognition confidence threshold"""
-        self.set_value('gesture_recognition', 'gesture_threshold', value)
-    
-    def get_gesture_cooldown(self) -> float:
-        """Get gesture cooldown period in seconds"""
-        return self.get_float('gesture_recognition', 'cooldown_period', 1.0)
-    
-    def set_gesture_cooldown(self, value: float):
-        """Set gesture cooldown period in seconds"""
-        self.set_value('gesture_recognition', 'cooldown_period', value)
-    
-    def get_smoothing_buffer_size(self) -> int:
-        """Get gesture smoothing buffer size"""
-        return self.get_int('gesture_recognition', 'smoothing_buffer_size', 5)
-    
-    def set_smoothing_buffer_size(self, value: int):
-        """Set gesture smoothing buffer size"""
-        self.set_value('gesture_recognition', 'smoothing_buffer_size', value)
-    
-    # System control settings
-    def get_action_cooldown(self) -> float:
-        """Get system action cooldown period in seconds"""
-        return self.get_float('system_control', 'action_cooldown', 1.0)
-    
-    def set_action_cooldown(self, value: float):
-        """Set system action cooldown period in seconds"""
-        self.set_value('system_control', 'action_cooldown', value)
-    
-    def get_volume_step(self) -> int:
-        """Get volume adjustment step size"""
-        return self.get_int('system_control', 'volume_step', 5)
-    
-    def set_volume_step(self, value: int):
-        """Set volume adjustment step size"""
-        self.set_value('system_control', 'volume_step', value)
-    
-    def is_audio_control_enabled(self) -> bool:
-        """Check if audio control is enabled"""
-        return self.get_boolean('system_control', 'enable_audio_control', True)
-    
-    def set_audio_control_enabled(self, enabled: bool):
-        """Enable or disable audio control"""
-        self.set_value('system_control', 'enable_audio_control', enabled)
+        self._ensure_loaded()
+        section = _intern(section)
+        key = _intern(key)
+        cache_key = (section, key, 'bool')
+        value = self._cache.get(cache_key)
+        if value is None:
+            raw = self._flat.get(section, {}).get(key)
+            if raw is None:
+                return fallback
+            value = raw.strip().lower() in self._BOOL_TRUE
+            self._cache[cache_key] = value
+        return value
     
     # UI settings
     def get_window_size(self) -> tuple:
         """Get main window size"""
-        width = self.get_int('ui', 'window_width', 1000)
-        height = self.get_int('ui', 'window_height', 700)
-        return (width, height)
-    
+        if self._window_size is None:
+            self._window_size = (self.get_int('ui', 'window_width', 1000),
+                                 self.get_int('ui', 'window_height', 700))
+        return self._window_size
+
     def set_window_size(self, width: int, height: int):
         """Set main window size"""
         self.set_value('ui', 'window_width', width)
         self.set_value('ui', 'window_height', height)
-    
+        self._window_size = (width, height)
+
     def get_camera_size(self) -> tuple:
         """Get camera preview size"""
-        width = self.get_int('ui', 'camera_width', 640)
-        height = self.get_int('ui', 'camera_height', 480)
-        return (width, height)
-    
+        if self._camera_size is None:
+            self._camera_size = (self.get_int('ui', 'camera_width', 640),
+                                 self.get_int('ui', 'camera_height', 480))
+        return self._camera_size
+
     def set_camera_size(self, width: int, height: int):
         """Set camera preview size"""
         self.set_value('ui', 'camera_width', width)
         self.set_value('ui', 'camera_height', height)
+        self._camera_size = (width, height)
     
-    def get_ui_update_rate(self) -> int:
-        """Get UI update rate in FPS"""
-        return self.get_int('ui', 'update_rate', 30)
-    
-    def set_ui_update_rate(self, rate: int):
-        """Set UI update rate in FPS"""
-        self.set_value('ui', 'update_rate', rate)
-    
-    # Performance settings
-    def get_target_fps(self) -> int:
-        """Get target processing FPS"""
-        return self.get_int('performance', 'target_fps', 30)
-    
-    def set_target_fps(self, fps: int):
-        """Set target processing FPS"""
-        self.set_value('performance', 'target_fps', fps)
-    
-    def get_max_cpu_usage(self) -> float:
-        """Get maximum CPU usage threshold"""
-        return self.get_float('performance', 'max_cpu_usage', 25.0)
-    
-    def set_max_cpu_usage(self, percentage: float):
-        """Set maximum CPU usage threshold"""
-        self.set_value('performance', 'max_cpu_usage', percentage)
-    
-    def get_max_memory_mb(self) -> int:
-        """Get maximum memory usage in MB"""
-        return self.get_int('performance', 'max_memory_mb', 200)
-    
-    def set_max_memory_mb(self, mb: int):
-        """Set maximum memory usage in MB"""
-        self.set_value('performance', 'max_memory_mb', mb)
-    
-    def is_gpu_acceleration_enabled(self) -> bool:
-        """Check if GPU acceleration is enabled"""
-        return self.get_boolean('performance', 'enable_gpu_acceleration', False)
-    
-    def set_gpu_acceleration_enabled(self, enabled: bool):
-        """Enable or disable GPU acceleration"""
-        self.set_value('performance', 'enable_gpu_acceleration', enabled)
-    
-    # Logging settings
-    def get_log_level(self) -> str:
-        """Get logging level"""
-        return self.get_value('logging', 'log_level', 'INFO')
-    
-    def set_log_level(self, level: str):
-        """Set logging level"""
-        self.set_value('logging', 'log_level', level)
-    
-    def is_log_to_file_enabled(self) -> bool:
-        """Check if logging to file is enabled"""
-        return self.get_boolean('logging', 'log_to_file', True)
-    
-    def set_log_to_file_enabled(self, enabled: bool):
-        """Enable or disable logging to file"""
-        self.set_value('logging', 'log_to_file', enabled)
-    
-    def get_max_log_size_mb(self) -> int:
-        """Get maximum log file size in MB"""
-        return self.get_int('logging', 'max_log_size_mb', 10)
-    
-    def set_max_log_size_mb(self, mb: int):
-        """Set maximum log file size in MB"""
-        self.set_value('logging', 'max_log_size_mb', mb)
-    
-    def get_all_settings(self) -> Dict[str, Dict[str, str]]:
-        """Get all configuration settings as dictionary"""
-        try:
-            settings = {}
-            for section_name in self.config.sections():
-                settings[section_name] = dict(self.config.items(section_name))
-            return settings
-            
-        except Exception as e:
-            self.logger.error(f"Error getting all settings: {e}")
-            return {}
+    def get_all_settings(self) -> Mapping[str, Dict[str, str]]:
+        """Get a read-only view of all configuration settings"""
+        self._ensure_loaded()
+        # Zero-copy: expose the flat mirror through a read-only proxy
+        # instead of rebuilding a nested dict per call
+        return MappingProxyType(self._flat)
     
     def reset_to_defaults(self):
         """Reset all settings to default values"""
+        self._ensure_loaded()
         try:
             self.config.clear()
+            self._cache.clear()
+            self._typed_cache.clear()
+            self._window_size = None
+            self._camera_size = None
             self.create_default_config()
             self.logger.info("Configuration reset to defaults")
             
         except Exception as e:
-            self.logger.error(f"Error resetting to defaults: {e}")
+            self.logger.error("Error resetting to defaults: %s", e)
     
-    def export_config(self, export_path: str) -> bool:
-        """Export configuration to specified path"""
+    def export_config(self, export_path) -> bool:
+        """Export configuration to a path or an open file-like object"""
+        self._ensure_loaded()
         try:
-            with open(export_path, 'w') as export_file:
-                self.config.write(export_file)
-            self.logger.info(f"Configuration exported to {export_path}")
+            if hasattr(export_path, 'write'):
+                self.config.write(export_path)
+            else:
+                self._atomic_write(export_path, self.config.write)
+            self.logger.info("Configuration exported to %s", export_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error exporting configuration: {e}")
+            self.logger.error("Error exporting configuration: %s", e)
             return False
     
-    def import_config(self, import_path: str) -> bool:
-        """Import configuration from specified path"""
+    def import_config(self, import_path) -> bool:
+        """Import configuration from a path or an open file-like object"""
+        self._ensure_loaded()
         try:
-            if not os.path.exists(import_path):
-                self.logger.error(f"Import file not found: {import_path}")
-                return False
-            
             temp_config = configparser.ConfigParser()
-            temp_config.read(import_path)
-            
-            # Validate imported config
+            if hasattr(import_path, 'read'):
+                temp_config.read_file(import_path)
+            elif not temp_config.read(import_path):
+                self.logger.error("Import file not found: %s", import_path)
+                return False
+
+            # Fill in any missing defaults, then always persist the
+            # imported state so it survives the next load
             self.config = temp_config
+            self._cache.clear()
+            self._typed_cache.clear()
+            self._window_size = None
+            self._camera_size = None
+            self._dirty_sections.update(self.config.sections())
             self.validate_config()
             self.save_config()
-            
-            self.logger.info(f"Configuration imported from {import_path}")
+            self._rebuild_flat()
+
+            self.logger.info("Configuration imported from %s", import_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error importing configuration: {e}")
+            self.logger.error("Error importing configuration: %s", e)
             return False
+
+
+def _install_accessors(cls):
+    """Generate the typed accessor methods declared in cls._ACCESSORS"""
+    generic = {'float': 'get_float', 'int': 'get_int',
+               'bool': 'get_boolean', 'str': 'get_value'}
+
+    def make_getter(name, getter_name, section, key, default):
+        def getter(self):
+            try:
+                return self._typed_cache[name]
+            except KeyError:
+                value = getattr(self, getter_name)(section, key, default)
+                self._typed_cache[name] = value
+                return value
+        return getter
+
+    def make_setter(name, section, key):
+        def setter(self, value):
+            self._typed_cache.pop(name, None)
+            self.set_value(section, key, value)
+        return setter
+
+    # Reverse map so the generic set_value can invalidate the typed
+    # memo entry covering the same (section, key)
+    cls._TYPED_BY_KEY = {}
+
+    for name, kind, section, key, default, description in cls._ACCESSORS:
+        section = _intern(section)
+        key = _intern(key)
+        cls._TYPED_BY_KEY[(section, key)] = name
+        getter = make_getter(name, generic[kind], section, key, default)
+        setter = make_setter(name, section, key)
+        if kind == 'bool':
+            getter.__name__ = f'is_{name}'
+            getter.__doc__ = f'Check if {description} is enabled'
+            setter.__doc__ = f'Enable or disable {description}'
+        else:
+            getter.__name__ = f'get_{name}'
+            getter.__doc__ = f'Get {description}'
+            setter.__doc__ = f'Set {description}'
+        setter.__name__ = f'set_{name}'
+        setattr(cls, getter.__name__, getter)
+        setattr(cls, setter.__name__, setter)
+    return cls
+
+
+_install_accessors(ConfigManager)
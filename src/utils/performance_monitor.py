@@ -5,103 +5,200 @@ Tracks system performance metrics and resource usage
 
 import psutil
 import time
-import threading
 import logging
-from collections import deque
+from array import array
 from typing import Dict, List, Optional
-import numpy as np
+
+
+class _MetricRing:
+    """Fixed-capacity single-writer ring of float32 samples.
+
+    The processing thread appends while the UI thread reads; writes go
+    to a slice of a preallocated contiguous buffer, so readers never
+    trigger the whole-structure copy that list(deque) required and the
+    running sum keeps averaging O(1).
+    """
+
+    __slots__ = ('_buf', '_off', '_size', '_head', '_count', '_sum')
+
+    def __init__(self, buf: array, offset: int, size: int):
+        # A window of the monitor's shared flat history buffer
+        self._buf = buf
+        self._off = offset
+        self._size = size
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value: float):
+        if self._count == self._size:
+            self._sum -= self._buf[self._off + self._head]
+        else:
+            self._count += 1
+        self._buf[self._off + self._head] = value
+        self._sum += value
+        self._head = (self._head + 1) % self._size
+
+    def last(self) -> float:
+        if not self._count:
+            return 0.0
+        return self._buf[self._off + (self._head - 1) % self._size]
+
+    def mean(self) -> float:
+        return self._sum / self._count if self._count else 0.0
+
+    def to_list(self) -> List[float]:
+        """Samples in append order, oldest first"""
+        off = self._off
+        if self._count < self._size:
+            return self._buf[off:off + self._count].tolist()
+        head = self._head
+        return (self._buf[off + head:off + self._size]
+                + self._buf[off:off + head]).tolist()
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
 
 
 class PerformanceMonitor:
     """Monitors system performance and resource usage"""
-    
+
+    # Minimum spacing between psutil samples; callers arriving sooner
+    # keep the previously sampled values
+    _MIN_INTERVAL = 0.5
+
+    # Overall status by 0-9 score (three bins per metric, three metrics)
+    _STATUS_BY_SCORE = ('Poor', 'Poor', 'Poor', 'Poor',
+                        'Fair', 'Fair',
+                        'Good', 'Good',
+                        'Excellent', 'Excellent')
+
     def __init__(self, history_size: int = 100):
         self.logger = logging.getLogger(__name__)
         self.history_size = history_size
         
-        # Performance metrics storage
-        self.fps_history = deque(maxlen=history_size)
-        self.cpu_history = deque(maxlen=history_size)
-        self.memory_history = deque(maxlen=history_size)
-        self.detection_rate_history = deque(maxlen=history_size)
+        # Performance metrics storage: one contiguous float32 block,
+        # one region per metric (FPS, CPU, MEM, DET); each ring writes
+        # into its region and keeps a running sum
+        self._hist = array('f', [0.0]) * (4 * history_size)
+        self.fps_history = _MetricRing(self._hist, 0, history_size)
+        self.cpu_history = _MetricRing(self._hist, history_size, history_size)
+        self.memory_history = _MetricRing(self._hist, 2 * history_size, history_size)
+        self.detection_rate_history = _MetricRing(self._hist, 3 * history_size, history_size)
+
+        # Wall-clock stamp per FPS sample, recorded at append time so
+        # get_performance_history doesn't reconstruct N timestamps per
+        # call (float64: epoch seconds don't fit float32 precision)
+        self._ts_buf = array('d', [0.0]) * history_size
+        self.timestamp_history = _MetricRing(self._ts_buf, 0, history_size)
         
         # Frame counting
         self.frame_count = 0
         self.detection_count = 0
-        self.last_fps_time = time.time()
+        # Monotonic clock for interval math: immune to NTP/wall-clock
+        # jumps that would produce negative or absurd FPS values
+        self.last_fps_time = time.monotonic()
         self.current_fps = 0.0
         
         # Performance thresholds (from config)
         self.max_cpu_percent = 25.0
         self.max_memory_mb = 200.0
         self.target_fps = 30.0
+        self._rebuild_bins()
         
-        # Monitoring control
-        self.monitoring_active = True
-        self.monitor_thread = None
-        
-        # Process reference for accurate monitoring
+        # Latest metrics snapshot, published as an immutable dict by
+        # atomic attribute rebind so UI readers never need a lock
+        self.latest_metrics = {
+            'fps': 0.0,
+            'cpu_percent': 0.0,
+            'memory_mb': 0.0,
+            'detection_rate': 0.0,
+            'frame_count': 0,
+            'detection_count': 0
+        }
+
+        # Reusable view returned by get_current_metrics; updated in
+        # place so the render loop doesn't allocate a dict per call
+        self._current_view = {
+            'fps': 0.0,
+            'cpu_percent': 0.0,
+            'memory_mb': 0.0,
+            'detection_rate': 0.0,
+            'frame_count': 0,
+            'detection_count': 0
+        }
+
+        # Process reference for accurate monitoring; bind the two
+        # sampled methods once instead of re-resolving the attribute
+        # chain every tick
         self.process = psutil.Process()
-        
-        # Start monitoring
-        self.start_monitoring()
-        
+        self._cpu_percent = self.process.cpu_percent
+        self._memory_info = self.process.memory_info
+        self._last_sample_t = 0.0
+
         self.logger.info("PerformanceMonitor initialized")
-    
-    def start_monitoring(self):
-        """Start performance monitoring thread"""
-        try:
-            self.monitoring_active = True
-            self.monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
-            self.monitor_thread.start()
-            self.logger.info("Performance monitoring started")
-            
-        except Exception as e:
-            self.logger.error(f"Error starting performance monitoring: {e}")
-    
-    def stop_monitoring(self):
-        """Stop performance monitoring"""
-        try:
-            self.monitoring_active = False
-            if self.monitor_thread and self.monitor_thread.is_alive():
-                self.monitor_thread.join(timeout=2.0)
-            self.logger.info("Performance monitoring stopped")
-            
-        except Exception as e:
-            self.logger.error(f"Error stopping performance monitoring: {e}")
-    
-    def monitor_loop(self):
-        """Main monitoring loop running in separate thread"""
-        while self.monitoring_active:
-            try:
-                # Update system metrics
-                self.update_system_metrics()
-                
-                # Sleep for monitoring interval
-                time.sleep(1.0)  # Update every second
-                
-            except Exception as e:
-                self.logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(1.0)
-    
+
+    def _rebuild_bins(self):
+        """Precompute threshold-derived state (scoring bins, summary view)"""
+        # Reused by reference in get_performance_summary; callers must
+        # treat it as immutable
+        self._thresholds_view = {
+            'max_cpu_percent': self.max_cpu_percent,
+            'max_memory_mb': self.max_memory_mb,
+            'target_fps': self.target_fps
+        }
+        self._fps_bins = (self.target_fps * 0.5,
+                          self.target_fps * 0.7,
+                          self.target_fps * 0.9)
+        self._cpu_bins = (self.max_cpu_percent * 0.7,
+                          self.max_cpu_percent,
+                          self.max_cpu_percent * 1.5)
+        self._mem_bins = (self.max_memory_mb * 0.7,
+                          self.max_memory_mb,
+                          self.max_memory_mb * 1.5)
+
     def update_system_metrics(self):
         """Update system performance metrics"""
         try:
-            # CPU usage
-            cpu_percent = self.process.cpu_percent()
+            # Rate-limit psutil sampling; a caller arriving inside the
+            # window just keeps the last published values
+            now = time.monotonic()
+            if now - self._last_sample_t < self._MIN_INTERVAL:
+                return
+            self._last_sample_t = now
+
+            # Batch the underlying /proc reads for both samples
+            with self.process.oneshot():
+                cpu_percent = self._cpu_percent()
+                memory_info = self._memory_info()
+
             self.cpu_history.append(cpu_percent)
-            
-            # Memory usage
-            memory_info = self.process.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024  # Convert to MB
+
+            # Memory usage: single multiply by 1/(1024*1024) to MB
+            memory_mb = memory_info.rss * 9.5367431640625e-07
             self.memory_history.append(memory_mb)
-            
+
             # Calculate detection rate
             detection_rate = 0.0
             if self.frame_count > 0:
                 detection_rate = self.detection_count / self.frame_count
             self.detection_rate_history.append(detection_rate)
             
+            # Publish a fresh snapshot for lock-free readers
+            self.latest_metrics = {
+                'fps': self.current_fps,
+                'cpu_percent': cpu_percent,
+                'memory_mb': memory_mb,
+                'detection_rate': detection_rate,
+                'frame_count': self.frame_count,
+                'detection_count': self.detection_count
+            }
+
             # Log warnings for high resource usage
             if cpu_percent > self.max_cpu_percent:
                 self.logger.warning(f"High CPU usage: {cpu_percent:.1f}%")
@@ -114,100 +211,72 @@ class PerformanceMonitor:
     
     def update_frame_processed(self):
         """Update frame processing counter"""
-        try:
-            self.frame_count += 1
-            
-            # Calculate FPS
-            current_time = time.time()
-            if current_time - self.last_fps_time >= 1.0:
-                self.current_fps = self.frame_count / (current_time - self.last_fps_time)
-                self.fps_history.append(self.current_fps)
-                
-                # Reset counters
-                self.frame_count = 0
-                self.detection_count = 0
-                self.last_fps_time = current_time
-                
-        except Exception as e:
-            self.logger.error(f"Error updating frame processed: {e}")
-    
+        self.frame_count += 1
+
+        # Calculate FPS
+        current_time = time.monotonic()
+        if current_time - self.last_fps_time >= 1.0:
+            self.current_fps = self.frame_count / (current_time - self.last_fps_time)
+            self.fps_history.append(self.current_fps)
+            self.timestamp_history.append(time.time())
+
+            # Refresh the published snapshot with the new FPS value
+            metrics = dict(self.latest_metrics)
+            metrics['fps'] = self.current_fps
+            self.latest_metrics = metrics
+
+            # Piggyback system sampling on the same 1 s clock; no
+            # dedicated monitor thread needed
+            self.update_system_metrics()
+
+            # Reset counters
+            self.frame_count = 0
+            self.detection_count = 0
+            self.last_fps_time = current_time
+
     def update_detection_processed(self):
         """Update detection processing counter"""
-        try:
-            self.detection_count += 1
-            
-        except Exception as e:
-            self.logger.error(f"Error updating detection processed: {e}")
+        self.detection_count += 1
     
     def get_current_metrics(self) -> Dict:
         """Get current performance metrics"""
-        try:
-            return {
-                'fps': self.current_fps,
-                'cpu_percent': self.get_current_cpu(),
-                'memory_mb': self.get_current_memory(),
-                'detection_rate': self.get_current_detection_rate(),
-                'frame_count': self.frame_count,
-                'detection_count': self.detection_count
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error getting current metrics: {e}")
-            return {}
+        view = self._current_view
+        view['fps'] = self.current_fps
+        view['cpu_percent'] = self.cpu_history.last()
+        view['memory_mb'] = self.memory_history.last()
+        view['detection_rate'] = self.detection_rate_history.last()
+        view['frame_count'] = self.frame_count
+        view['detection_count'] = self.detection_count
+        return view
     
     def get_current_cpu(self) -> float:
         """Get current CPU usage percentage"""
-        try:
-            if self.cpu_history:
-                return self.cpu_history[-1]
-            return 0.0
-            
-        except Exception as e:
-            self.logger.error(f"Error getting current CPU: {e}")
-            return 0.0
-    
+        return self.cpu_history.last()
+
     def get_current_memory(self) -> float:
         """Get current memory usage in MB"""
-        try:
-            if self.memory_history:
-                return self.memory_history[-1]
-            return 0.0
-            
-        except Exception as e:
-            self.logger.error(f"Error getting current memory: {e}")
-            return 0.0
-    
+        return self.memory_history.last()
+
     def get_current_detection_rate(self) -> float:
         """Get current detection rate"""
-        try:
-            if self.detection_rate_history:
-                return self.detection_rate_history[-1]
-            return 0.0
-            
-        except Exception as e:
-            self.logger.error(f"Error getting current detection rate: {e}")
-            return 0.0
+        return self.detection_rate_history.last()
     
-    def get_average_metrics(self, window_size: int = 10) -> Dict:
-        """Get average metrics over specified window"""
+    def get_average_metrics(self) -> Dict:
+        """Get average metrics over the retained history"""
         try:
-            window_size = min(window_size, len(self.fps_history))
-            
-            if window_size == 0:
+            fps_len = len(self.fps_history)
+            if fps_len == 0:
                 return self.get_current_metrics()
-            
-            # Calculate averages
-            avg_fps = np.mean(list(self.fps_history)[-window_size:])
-            avg_cpu = np.mean(list(self.cpu_history)[-window_size:])
-            avg_memory = np.mean(list(self.memory_history)[-window_size:])
-            avg_detection_rate = np.mean(list(self.detection_rate_history)[-window_size:])
-            
+
+            # O(1): each ring divides its maintained running sum; each
+            # history has its own length since FPS and system metrics
+            # tick separately
             return {
-                'avg_fps': avg_fps,
-                'avg_cpu_percent': avg_cpu,
-                'avg_memory_mb': avg_memory,
-                'avg_detection_rate': avg_detection_rate,
-                'window_size': window_size
+                'avg_fps': self.fps_history.mean(),
+                'avg_cpu_percent': self.cpu_history.mean(),
+                'avg_memory_mb': self.memory_history.mean(),
+                'avg_detection_rate': self.detection_rate_history.mean(),
+                'window_size': fps_len
             }
             
         except Exception as e:
@@ -219,12 +288,12 @@ class PerformanceMonitor:
         try:
             current = self.get_current_metrics()
             averages = self.get_average_metrics()
-            
-            # Calculate performance status
-            fps_status = "Good" if current.get('fps', 0) >= self.target_fps * 0.8 else "Poor"
-            cpu_status = "Good" if current.get('cpu_percent', 0) <= self.max_cpu_percent else "High"
-            memory_status = "Good" if current.get('memory_mb', 0) <= self.max_memory_mb else "High"
-            
+
+            # Calculate performance status from the single snapshot
+            fps_status = "Good" if current['fps'] >= self.target_fps * 0.8 else "Poor"
+            cpu_status = "Good" if current['cpu_percent'] <= self.max_cpu_percent else "High"
+            memory_status = "Good" if current['memory_mb'] <= self.max_memory_mb else "High"
+
             return {
                 'current_metrics': current,
                 'average_metrics': averages,
@@ -232,61 +301,31 @@ class PerformanceMonitor:
                     'fps': fps_status,
                     'cpu': cpu_status,
                     'memory': memory_status,
-                    'overall': self.get_overall_performance_status()
+                    'overall': self.get_overall_performance_status(current)
                 },
-                'thresholds': {
-                    'max_cpu_percent': self.max_cpu_percent,
-                    'max_memory_mb': self.max_memory_mb,
-                    'target_fps': self.target_fps
-                }
+                'thresholds': self._thresholds_view
             }
             
         except Exception as e:
             self.logger.error(f"Error getting performance summary: {e}")
             return {}
     
-    def get_overall_performance_status(self) -> str:
+    def get_overall_performance_status(self, current: Dict = None) -> str:
         """Get overall performance status"""
         try:
-            current = self.get_current_metrics()
-            
+            if current is None:
+                current = self.get_current_metrics()
+
             fps = current.get('fps', 0)
             cpu = current.get('cpu_percent', 0)
             memory = current.get('memory_mb', 0)
-            
-            # Performance scoring
-            score = 0
-            
-            if fps >= self.target_fps * 0.9:
-                score += 3
-            elif fps >= self.target_fps * 0.7:
-                score += 2
-            elif fps >= self.target_fps * 0.5:
-                score += 1
-            
-            if cpu <= self.max_cpu_percent * 0.7:
-                score += 3
-            elif cpu <= self.max_cpu_percent:
-                score += 2
-            elif cpu <= self.max_cpu_percent * 1.5:
-                score += 1
-            
-            if memory <= self.max_memory_mb * 0.7:
-                score += 3
-            elif memory <= self.max_memory_mb:
-                score += 2
-            elif memory <= self.max_memory_mb * 1.5:
-                score += 1
-            
-            # Determine status based on score
-            if score >= 8:
-                return "Excellent"
-            elif score >= 6:
-                return "Good"
-            elif score >= 4:
-                return "Fair"
-            else:
-                return "Poor"
+
+            # Score each metric against its precomputed bins and read
+            # the status straight from the lookup table
+            score = (sum(fps >= b for b in self._fps_bins)
+                     + sum(cpu <= b for b in self._cpu_bins)
+                     + sum(memory <= b for b in self._mem_bins))
+            return self._STATUS_BY_SCORE[score]
                 
         except Exception as e:
             self.logger.error(f"Error getting overall performance status: {e}")
@@ -296,11 +335,11 @@ class PerformanceMonitor:
         """Get performance history data"""
         try:
             return {
-                'fps_history': list(self.fps_history),
-                'cpu_history': list(self.cpu_history),
-                'memory_history': list(self.memory_history),
-                'detection_rate_history': list(self.detection_rate_history),
-                'timestamps': [time.time() - i for i in range(len(self.fps_history)-1, -1, -1)]
+                'fps_history': self.fps_history.to_list(),
+                'cpu_history': self.cpu_history.to_list(),
+                'memory_history': self.memory_history.to_list(),
+                'detection_rate_history': self.detection_rate_history.to_list(),
+                'timestamps': self.timestamp_history.to_list()
             }
             
         except Exception as e:
@@ -312,31 +351,33 @@ class PerformanceMonitor:
         warnings = []
         
         try:
-            current = self.get_current_metrics()
-            
+            # Read the scalars directly; no snapshot dict needed just to
+            # compare against thresholds, and formatting only happens on
+            # the rare violation branches below
+            fps = self.current_fps
+            cpu = self.cpu_history.last()
+            memory = self.memory_history.last()
+            detection_rate = self.detection_rate_history.last()
+
             # FPS warnings
-            fps = current.get('fps', 0)
             if fps < self.target_fps * 0.5:
                 warnings.append(f"Very low FPS: {fps:.1f} (target: {self.target_fps})")
             elif fps < self.target_fps * 0.8:
                 warnings.append(f"Low FPS: {fps:.1f} (target: {self.target_fps})")
             
             # CPU warnings
-            cpu = current.get('cpu_percent', 0)
             if cpu > self.max_cpu_percent * 1.5:
                 warnings.append(f"Very high CPU usage: {cpu:.1f}% (max: {self.max_cpu_percent}%)")
             elif cpu > self.max_cpu_percent:
                 warnings.append(f"High CPU usage: {cpu:.1f}% (max: {self.max_cpu_percent}%)")
             
             # Memory warnings
-            memory = current.get('memory_mb', 0)
             if memory > self.max_memory_mb * 1.5:
                 warnings.append(f"Very high memory usage: {memory:.1f} MB (max: {self.max_memory_mb} MB)")
             elif memory > self.max_memory_mb:
                 warnings.append(f"High memory usage: {memory:.1f} MB (max: {self.max_memory_mb} MB)")
             
             # Detection rate warnings
-            detection_rate = current.get('detection_rate', 0)
             if detection_rate < 0.3:
                 warnings.append(f"Low detection rate: {detection_rate*100:.1f}%")
             
@@ -355,7 +396,9 @@ class PerformanceMonitor:
                 self.max_memory_mb = max_memory
             if target_fps is not None:
                 self.target_fps = target_fps
-                
+
+            self._rebuild_bins()
+            
             self.logger.info(f"Performance thresholds updated: CPU={self.max_cpu_percent}%, "
                            f"Memory={self.max_memory_mb}MB, FPS={self.target_fps}")
             
@@ -369,11 +412,12 @@ class PerformanceMonitor:
             self.cpu_history.clear()
             self.memory_history.clear()
             self.detection_rate_history.clear()
-            
+            self.timestamp_history.clear()
+
             self.frame_count = 0
             self.detection_count = 0
             self.current_fps = 0.0
-            self.last_fps_time = time.time()
+            self.last_fps_time = time.monotonic()
             
             self.logger.info("Performance metrics reset")
             
@@ -382,9 +426,5 @@ class PerformanceMonitor:
     
     def cleanup(self):
         """Cleanup performance monitor"""
-        try:
-            self.stop_monitoring()
-            self.logger.info("PerformanceMonitor cleanup completed")
-            
-        except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+        # Nothing to tear down since sampling rides the frame loop
+        self.logger.info("PerformanceMonitor cleanup completed")